@@ -1,13 +1,19 @@
 def _set_version():
     """Set check50 __version__"""
     global __version__
-    from pkg_resources import get_distribution, DistributionNotFound
     import os
+    # importlib.metadata is much cheaper to import than pkg_resources, but requires Python 3.8+
+    try:
+        from importlib.metadata import distribution as get_distribution, PackageNotFoundError as DistributionNotFound
+        location = lambda dist: str(dist.locate_file(""))
+    except ImportError:
+        from pkg_resources import get_distribution, DistributionNotFound
+        location = lambda dist: dist.location
     # https://stackoverflow.com/questions/17583443/what-is-the-correct-way-to-share-package-version-with-setup-py-and-the-package
     try:
         dist = get_distribution("check50")
         # Normalize path for cross-OS compatibility.
-        dist_loc = os.path.normcase(dist.location)
+        dist_loc = os.path.normcase(location(dist))
         here = os.path.normcase(__file__)
         if not here.startswith(os.path.join(dist_loc, "check50")):
             # This version is not installed, but another version is.
@@ -20,10 +26,10 @@ def _set_version():
 
 def _setup_translation():
     import gettext
-    from pkg_resources import resource_filename
+    import os
     global _translation
     _translation = gettext.translation(
-        "check50", resource_filename("check50", "locale"), fallback=True)
+        "check50", os.path.join(os.path.dirname(__file__), "locale"), fallback=True)
     _translation.install()
 
 
@@ -116,10 +116,12 @@ def install_dependencies(dependencies, verbose=False):
         req_file = Path(req_dir) / "requirements.txt"
 
         with open(req_file, "w") as f:
-            for dependency in dependencies:
+            # Deduplicate while preserving order
+            for dependency in dict.fromkeys(dependencies):
                 f.write(f"{dependency}\n")
 
-        pip = [sys.executable or "python3", "-m", "pip", "install", "-r", req_file]
+        # Skip pip's self version check, it costs a round trip to PyPI on every run
+        pip = [sys.executable or "python3", "-m", "pip", "install", "--disable-pip-version-check", "-r", req_file]
         # Unless we are in a virtualenv, we need --user
         if sys.base_prefix == sys.prefix and not hasattr(sys, "real_prefix"):
             pip.append("--user")
@@ -334,7 +336,7 @@ def main():
             useless_args.append("--no-install-dependencies")
 
         if useless_args:
-            termcolor.cprint(_("Warning: you should always use --local when using: {}".format(", ".join(useless_args))),
+            termcolor.cprint(_("Warning: you should always use --local when using: {}").format(", ".join(useless_args)),
                 "yellow", attrs=["bold"])
 
     # Filter out any duplicates from args.output
@@ -1,6 +1,8 @@
 import hashlib
 import functools
+import mmap
 import os
+import re
 import shlex
 import shutil
 import signal
@@ -79,12 +81,14 @@ def hash(file):
     exists(file)
     log(_("hashing {}...").format(file))
 
-    # https://stackoverflow.com/a/22058673
     with open(file, "rb") as f:
-        sha256 = hashlib.sha256()
-        for block in iter(lambda: f.read(65536), b""):
-            sha256.update(block)
-        return sha256.hexdigest()
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        # mmap refuses to map empty files
+        if os.fstat(f.fileno()).st_size == 0:
+            return hashlib.sha256().hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return hashlib.sha256(mm).hexdigest()
 
 
 def exists(*paths):
@@ -155,12 +159,12 @@ class run:
     def __init__(self, command, env={}):
         log(_("running {}...").format(command))
 
-        full_env = os.environ.copy()
-        full_env.update(env)
+        # Only build a new environment if there are overrides, otherwise the child inherits ours
+        full_env = {**os.environ, **env} if env else None
 
         # Workaround for OSX pexpect bug http://pexpect.readthedocs.io/en/stable/commonissues.html#truncated-output-just-before-child-exits
         # Workaround from https://github.com/pexpect/pexpect/issues/373
-        command = "bash -c {}".format(shlex.quote(command))
+        command = f"bash -c {shlex.quote(command)}"
         self.process = pexpect.spawn(command, encoding="utf-8", echo=False, env=full_env)
 
     def stdin(self, line, prompt=True, timeout=3):
@@ -178,14 +182,14 @@ class run:
         :raises check50.Failure: if ``prompt`` is set to True and no prompt is given
 
         """
-        if line == EOF:
+        if line is EOF:
             log("sending EOF...")
         else:
             log(_("sending input {}...").format(line))
 
         if prompt:
             try:
-                self.process.expect(".+", timeout=timeout)
+                self.process.expect(_compile(".+", re.DOTALL), timeout=timeout)
             except (TIMEOUT, EOF):
                 raise Failure(_("expected prompt for input, found none"))
             except UnicodeDecodeError:
@@ -194,12 +198,12 @@ class run:
             # Consume everything on the output buffer
             try:
                 for _i in range(int(timeout * 10)):
-                    self.process.expect(".+", timeout=0.1)
+                    self.process.expect(_compile(".+", re.DOTALL), timeout=0.1)
             except (TIMEOUT, EOF):
                 pass
 
         try:
-            if line == EOF:
+            if line is EOF:
                 self.process.sendeof()
             else:
                 self.process.sendline(line)
@@ -249,17 +253,20 @@ class run:
         if str_output is None:
             str_output = output
 
-        if output == EOF:
+        if output is EOF:
             log(_("checking for EOF..."))
         else:
             output = output.replace("\n", "\r\n")
             log(_("checking for output \"{}\"...").format(str_output))
 
         try:
+            if regex and output is not EOF:
+                # Same flags pexpect would compile a string pattern with
+                output = _compile(output, re.DOTALL)
             expect(output, timeout=timeout)
         except EOF:
             result = self.process.before + self.process.buffer
-            if self.process.after != EOF:
+            if self.process.after is not EOF:
                 result += self.process.after
             raise Mismatch(str_output, result.replace("\r\n", "\n"))
         except TIMEOUT:
@@ -270,7 +277,7 @@ class run:
             raise Failure(_("check50 could not verify output"))
 
         # If we expected EOF and we still got output, report an error.
-        if output == EOF and self.process.before:
+        if output is EOF and self.process.before:
             raise Mismatch(EOF, self.process.before.replace("\r\n", "\n"))
 
         return self
@@ -429,10 +436,10 @@ class Mismatch(Failure):
     def __init__(self, expected, actual, help=None):
         super().__init__(rationale=_("expected {}, not {}").format(_raw(expected), _raw(actual)), help=help)
 
-        if expected == EOF:
+        if expected is EOF:
             expected = "EOF"
 
-        if actual == EOF:
+        if actual is EOF:
             actual = "EOF"
 
         self.payload.update({"expected": expected, "actual": actual})
@@ -474,7 +481,7 @@ def _raw(s):
     if isinstance(s, list):
         s = "\n".join(_raw(item) for item in s)
 
-    if s == EOF:
+    if s is EOF:
         return "EOF"
 
     s = f'"{repr(str(s))[1:-1]}"'
@@ -483,6 +490,12 @@ def _raw(s):
     return s
 
 
+@functools.lru_cache(maxsize=256)
+def _compile(pattern, flags=0):
+    """Compile pattern, caching the result as checks tend to reuse a handful of patterns."""
+    return re.compile(pattern, flags)
+
+
 def _copy(src, dst):
     """Copy src to dst, copying recursively if src is a directory."""
     try:
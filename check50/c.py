@@ -99,34 +99,44 @@ def _check_valgrind(xml_file):
     """Log and report any errors encountered by valgrind."""
     log(_("checking for valgrind errors..."))
 
-    # Load XML file created by valgrind
-    xml = ET.ElementTree(file=xml_file)
-
     # Ensure that we don't get duplicate error messages.
     reported = set()
-    for error in xml.iterfind("error"):
+
+    # Stream the XML created by valgrind rather than loading all of it at once
+    events = ET.iterparse(xml_file, events=("start", "end"))
+    _event, root = next(events)
+    for event, error in events:
+        if event != "end" or error.tag != "error":
+            continue
+
         # Type of error valgrind encountered
         kind = error.find("kind").text
 
         # Valgrind's error message
         what = error.find("xwhat/text" if kind.startswith("Leak_") else "what").text
 
-        # Error message that we will report
-        msg = ["\t", what]
-
         # Find first stack frame within student's code.
+        location = None
         for frame in error.iterfind("stack/frame"):
             obj = frame.find("obj")
             if obj is not None and internal.run_dir in Path(obj.text).parents:
                 file, line = frame.find("file"), frame.find("line")
                 if file is not None and line is not None:
-                    msg.append(f": ({_('file')}: {file.text}, {_('line')}: {line.text})")
+                    location = (file.text, line.text)
                 break
 
-        msg = "".join(msg)
-        if msg not in reported:
-            log(msg)
-            reported.add(msg)
+        # Drop everything parsed so far (including this error), we no longer need it
+        root.clear()
+
+        if (what, location) in reported:
+            continue
+        reported.add((what, location))
+
+        # Error message that we will report
+        msg = ["\t", what]
+        if location is not None:
+            msg.append(f": ({_('file')}: {location[0]}, {_('line')}: {location[1]})")
+        log("".join(msg))
 
     # Only raise exception if we encountered errors.
     if reported:
@@ -1,12 +1,9 @@
 import pathlib
-import re
 import sys
 import urllib.parse as url
 import warnings
 
-from bs4 import BeautifulSoup
-
-from ._api import log, Failure
+from ._api import log, Failure, _compile
 from . import internal
 
 
@@ -123,10 +120,17 @@ class app:
             raise Failure(_("expected request to return HTML, but it returned {}").format(
                 self.response.mimetype))
 
-        # TODO: Remove once beautiful soup updates to accomodate python 3.7
-        with warnings.catch_warnings():
-            warnings.filterwarnings("ignore", category=DeprecationWarning)
-            content = BeautifulSoup(self.response.data, "html.parser")
+        # Parse each response at most once, no matter how often its content is searched
+        try:
+            content = self.response._soup
+        except AttributeError:
+            # Imported here as most flask checks never look at the HTML itself
+            from bs4 import BeautifulSoup
+
+            # TODO: Remove once beautiful soup updates to accomodate python 3.7
+            with warnings.catch_warnings():
+                warnings.filterwarnings("ignore", category=DeprecationWarning)
+                content = self.response._soup = BeautifulSoup(self.response.data, "html.parser")
 
         return self._search_page(
             output,
@@ -154,7 +158,7 @@ class app:
 
         log(_("checking that \"{}\" is in page").format(str_output))
 
-        regex = re.compile(output)
+        regex = _compile(output)
 
         if not match_fn(regex, content):
             raise Failure(
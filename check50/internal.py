@@ -2,7 +2,7 @@
 Additional check50 internals exposed to extension writers in addition to the standard API
 """
 
-import importlib
+import importlib.util
 from pathlib import Path
 import sys
 
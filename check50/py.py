@@ -1,6 +1,7 @@
 import importlib
 from pathlib import Path
 import py_compile
+import shutil
 import traceback
 
 from . import internal
@@ -29,9 +30,10 @@ def append_code(original, codefile):
         # Overwrite the lookup function in helpers.py with our own implementation.
         check50.py.append_code("helpers.py", "lookup.py")
     """
-    with open(codefile) as code, open(original, "a") as o:
-        o.write("\n")
-        o.writelines(code)
+    # Copy bytes as is, there's no need to decode and re-encode the code line by line
+    with open(codefile, "rb") as code, open(original, "ab") as o:
+        o.write(b"\n")
+        shutil.copyfileobj(code, o)
 
 
 def import_(path):
@@ -1,14 +1,15 @@
 import json
 import pathlib
 
-import jinja2
-import pkg_resources
 import termcolor
 
-TEMPLATES = pathlib.Path(pkg_resources.resource_filename("check50.renderer", "templates"))
+TEMPLATES = pathlib.Path(__file__).parent / "templates"
 
 
 def to_html(slug, results, version):
+    # Only HTML output needs jinja2, so don't pay for importing it otherwise
+    import jinja2
+
     with open(TEMPLATES / "results.html") as f:
         content = f.read()
 
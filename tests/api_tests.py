@@ -1,3 +1,4 @@
+import hashlib
 import unittest
 import os
 import pathlib
@@ -58,6 +59,25 @@ class TestExists(Base):
         check50.exists(self.filename)
 
 
+class TestHash(Base):
+    def test_hash(self):
+        self.write("foo")
+        self.assertEqual(check50.hash(self.filename), hashlib.sha256(b"foo").hexdigest())
+
+    def test_empty_file(self):
+        self.assertEqual(check50.hash(self.filename), hashlib.sha256(b"").hexdigest())
+
+    def test_modified_file(self):
+        self.write("foo")
+        check50.hash(self.filename)
+        self.write("foobar")
+        self.assertEqual(check50.hash(self.filename), hashlib.sha256(b"foobar").hexdigest())
+
+    def test_file_does_not_exist(self):
+        with self.assertRaises(check50.Failure):
+            check50.hash("i_do_not_exist")
+
+
 class TestImportChecks(Base):
     def setUp(self):
         super().setUp()
@@ -93,6 +113,11 @@ class TestRun(Base):
     def test_returns_process(self):
         self.process = check50.run("python3 ./{self.filename}")
 
+    def test_env(self):
+        self.write("import os\nprint(os.environ.get('FOO'), os.environ.get('HOME'))")
+        self.process = check50.run(f"python3 ./{self.filename}", env={"FOO": "bar"})
+        self.assertEqual(self.process.stdout(), f"bar {os.environ.get('HOME')}\n")
+
 
 class TestProcessKill(Base):
     def test_kill(self):
@@ -156,6 +181,17 @@ class TestProcessStdout(Base):
         self.process.stdout(".o.")
         self.process.stdout("\n")
 
+    def test_out_eof(self):
+        self.runpy()
+        self.process.stdout(check50.EOF)
+
+        self.write("print('foo')")
+        self.runpy()
+        with self.assertRaises(check50.Mismatch) as cm:
+            self.process.stdout(check50.EOF)
+        self.assertEqual(cm.exception.payload["expected"], "EOF")
+        self.assertEqual(cm.exception.payload["actual"], "foo\n")
+
     def test_out_no_regex(self):
         self.write("print('foo')")
         self.runpy()
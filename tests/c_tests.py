@@ -75,6 +75,52 @@ class TestValgrind(Base):
         check50.internal.check_running = False
 
 
+class TestCheckValgrind(unittest.TestCase):
+    def setUp(self):
+        self.working_directory = tempfile.TemporaryDirectory()
+        os.chdir(self.working_directory.name)
+        self._old_run_dir = check50.internal.run_dir
+        check50.internal.run_dir = pathlib.Path(self.working_directory.name).absolute()
+        self.xml_file = tempfile.NamedTemporaryFile()
+        check50._api._log.clear()
+
+    def tearDown(self):
+        check50.internal.run_dir = self._old_run_dir
+        self.xml_file.close()
+        self.working_directory.cleanup()
+
+    def error(self, kind, what, obj, line):
+        what = f"<xwhat><text>{what}</text></xwhat>" if kind.startswith("Leak_") else f"<what>{what}</what>"
+        frames = "<frame><obj>/usr/lib/libc.so</obj></frame>" \
+                 f"<frame><obj>{obj}</obj><file>foo.c</file><line>{line}</line></frame>"
+        return f"<error><kind>{kind}</kind>{what}<stack>{frames}</stack></error>"
+
+    def check_valgrind(self, *errors):
+        self.xml_file.write(f"<?xml version=\"1.0\"?><valgrindoutput><pid>1</pid>{''.join(errors)}</valgrindoutput>".encode())
+        self.xml_file.flush()
+        self.xml_file.seek(0)
+        check50.c._check_valgrind(self.xml_file)
+
+    def test_no_errors(self):
+        self.check_valgrind()
+        self.assertEqual(check50._api._log, ["checking for valgrind errors..."])
+
+    def test_errors(self):
+        foo = str(check50.internal.run_dir / "foo")
+        with self.assertRaises(check50.Failure):
+            self.check_valgrind(
+                self.error("Leak_DefinitelyLost", "4 bytes lost", foo, 3),
+                self.error("Leak_DefinitelyLost", "4 bytes lost", foo, 3),
+                self.error("InvalidRead", "invalid read", "/usr/lib/bar.so", 5),
+                self.error("InvalidRead", "invalid read", foo, 7))
+
+        self.assertEqual(check50._api._log, [
+            "checking for valgrind errors...",
+            "\t4 bytes lost: (file: foo.c, line: 3)",
+            "\tinvalid read",
+            "\tinvalid read: (file: foo.c, line: 7)"])
+
+
 if __name__ == "__main__":
     suite = unittest.TestLoader().loadTestsFromModule(module=sys.modules[__name__])
     unittest.TextTestRunner(verbosity=2).run(suite)
@@ -336,6 +336,17 @@ class TestPayloadCheck(Base):
         self.assertEqual(pathlib.Path(error["data"]["dir"]).stem, pathlib.Path(self.working_directory.name).stem)
 
 
+class TestIsolation(Base):
+    def test_module_state_is_not_shared(self):
+        env = {**os.environ, "CHECK50_WORKERS": "1"}
+        pexpect.run(f"check50 --dev -o json --output-file foo.json {CHECKS_DIRECTORY}/isolation", env=env)
+        with open("foo.json", "r") as f:
+            output = json.load(f)
+
+        seen = {result["name"]: result["data"]["seen"] for result in output["results"]}
+        self.assertEqual(seen, {"a": ["a"], "b": ["b"], "c": ["c"], "d": ["d"]})
+
+
 class TestTarget(Base):
     def test_target(self):
         open("foo.py", "w").close()
@@ -383,6 +394,16 @@ class TestTarget(Base):
         self.assertEqual(output["results"][0]["name"], "exists4")
         self.assertEqual(output["results"][1]["name"], "exists5")
 
+    def test_unknown_target(self):
+        open("foo.py", "w").close()
+
+        pexpect.run(f"check50 --dev -o json --output-file foo.json --target foo -- {CHECKS_DIRECTORY}/target")
+        with open("foo.json", "r") as f:
+            output = json.load(f)
+
+        self.assertEqual(output["error"]["type"], "Error")
+        self.assertEqual(output["error"]["value"], "Unknown check: foo")
+
 
 if __name__ == "__main__":
     unittest.main()
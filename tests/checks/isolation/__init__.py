@@ -0,0 +1,18 @@
+import check50
+
+less = check50.import_checks("less")
+from less import *
+
+seen = []
+
+@check50.check()
+def a():
+    """a"""
+    seen.append("a")
+    check50.data(seen=seen)
+
+@check50.check()
+def b():
+    """b"""
+    seen.append("b")
+    check50.data(seen=seen)
@@ -0,0 +1,15 @@
+import check50
+
+_seen = []
+
+@check50.check()
+def c():
+    """c"""
+    _seen.append("c")
+    check50.data(seen=_seen)
+
+@check50.check()
+def d():
+    """d"""
+    _seen.append("d")
+    check50.data(seen=_seen)
@@ -50,6 +50,15 @@ class TestAppendCode(Base):
         self.assertEqual(content2, old_content2)
         self.assertEqual(content1, "qux\nbaz")
 
+    def test_append_crlf(self):
+        with open(self.other_filename, "wb") as f:
+            f.write(b"baz\r\nqux\r\n")
+
+        self.write("foo\n")
+        check50.py.append_code(self.filename, self.other_filename)
+        with open(self.filename, "rb") as f:
+            self.assertEqual(f.read(), b"foo\n\nbaz\r\nqux\r\n")
+
 
 class TestImport_(Base):
     def setUp(self):
@@ -0,0 +1,69 @@
+import unittest
+import os
+import pathlib
+import tempfile
+
+import check50
+import check50.internal
+
+
+class Base(unittest.TestCase):
+    def setUp(self):
+        self.working_directory = tempfile.TemporaryDirectory()
+        os.chdir(self.working_directory.name)
+        self.checks_root = pathlib.Path(self.working_directory.name).absolute()
+
+    def tearDown(self):
+        self.working_directory.cleanup()
+
+
+class TestCheckStaging(Base):
+    def setUp(self):
+        super().setUp()
+        self._old_check_dir = check50.internal.check_dir
+
+        # Student files every check is staged from
+        os.makedirs("-/sub")
+        with open("-/data.txt", "w") as f:
+            f.write("foo")
+        with open("-/sub/nested.txt", "w") as f:
+            f.write("bar")
+
+        # Check directory with a file to include
+        os.mkdir("checks")
+        with open("checks/data.txt", "w") as f:
+            f.write("baz")
+        check50.internal.check_dir = self.checks_root / "checks"
+
+    def tearDown(self):
+        super().tearDown()
+        check50.internal.check_dir = self._old_check_dir
+
+    def test_siblings_are_isolated(self):
+        @check50.check()
+        def writes():
+            check50.include("data.txt")
+            with open("sub/nested.txt", "w") as f:
+                f.write("qux")
+
+        @check50.check()
+        def reads():
+            with open("data.txt") as f1, open("sub/nested.txt") as f2:
+                return f1.read(), f2.read()
+
+        result, _ = writes(self.checks_root, None)
+        self.assertTrue(result.passed)
+
+        result, state = reads(self.checks_root, None)
+        self.assertTrue(result.passed)
+        self.assertEqual(state, ("foo", "bar"))
+
+        with open(self.checks_root / "-" / "data.txt") as f1, open(self.checks_root / "-" / "sub" / "nested.txt") as f2:
+            self.assertEqual((f1.read(), f2.read()), ("foo", "bar"))
+
+        with open(self.checks_root / "writes" / "data.txt") as f1, open(self.checks_root / "writes" / "sub" / "nested.txt") as f2:
+            self.assertEqual((f1.read(), f2.read()), ("baz", "qux"))
+
+
+if __name__ == "__main__":
+    unittest.main()